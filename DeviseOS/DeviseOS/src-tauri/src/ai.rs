@@ -3,13 +3,64 @@ use candle_nn::VarBuilder;
 use candle_transformers::models::distilbert::DistilBertModel;
 use tokenizers::Tokenizer;
 use std::path::Path;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
+use std::sync::OnceLock;
 use crate::{
     AppError, AppResult, 
     models::{AIProcessingResult, SearchResult, Note, EmbeddingModel, WhisperModel},
     database::Database,
 };
 
+// Word lists used by the heuristic text analysis. They are built once and
+// shared, so each lookup is a hash probe instead of a scan over an array
+// literal that was rebuilt on every call.
+static COMMON_WORDS: OnceLock<HashSet<&'static str>> = OnceLock::new();
+static POSITIVE_WORDS: OnceLock<HashSet<&'static str>> = OnceLock::new();
+static NEGATIVE_WORDS: OnceLock<HashSet<&'static str>> = OnceLock::new();
+
+fn common_words() -> &'static HashSet<&'static str> {
+    COMMON_WORDS.get_or_init(|| {
+        [
+            "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with",
+            "by", "from", "up", "about", "into", "through", "during", "before",
+            "after", "above", "below", "between", "among", "within", "without",
+            "this", "that", "these", "those", "is", "are", "was", "were", "be",
+            "been", "being", "have", "has", "had", "do", "does", "did", "will",
+            "would", "could", "should", "may", "might", "can", "shall", "must",
+            "not", "no", "yes", "if", "then", "else", "when", "where", "why",
+            "how", "what", "who", "which", "whose", "whom", "all", "any", "both",
+            "each", "few", "more", "most", "other", "some", "such", "only", "own",
+            "same", "so", "than", "too", "very", "just",
+        ]
+        .into_iter()
+        .collect()
+    })
+}
+
+fn positive_words() -> &'static HashSet<&'static str> {
+    POSITIVE_WORDS.get_or_init(|| {
+        [
+            "good", "great", "excellent", "amazing", "wonderful", "fantastic",
+            "love", "like", "enjoy", "happy", "joy", "success", "win", "best",
+            "awesome", "brilliant", "perfect", "outstanding", "superb", "marvelous"
+        ]
+        .into_iter()
+        .collect()
+    })
+}
+
+fn negative_words() -> &'static HashSet<&'static str> {
+    NEGATIVE_WORDS.get_or_init(|| {
+        [
+            "bad", "terrible", "awful", "horrible", "hate", "dislike", "sad",
+            "angry", "frustrated", "fail", "lose", "worst", "problem", "issue",
+            "difficult", "hard", "challenging", "disappointing", "poor", "weak"
+        ]
+        .into_iter()
+        .collect()
+    })
+}
+
 pub struct AIService {
     device: Device,
     whisper_model: Option<WhisperModel>,
@@ -213,17 +264,8 @@ impl AIService {
         // Simple sentiment analysis using word lists
         // In a real implementation, you would use a trained sentiment model
         
-        let positive_words = [
-            "good", "great", "excellent", "amazing", "wonderful", "fantastic",
-            "love", "like", "enjoy", "happy", "joy", "success", "win", "best",
-            "awesome", "brilliant", "perfect", "outstanding", "superb", "marvelous"
-        ];
-        
-        let negative_words = [
-            "bad", "terrible", "awful", "horrible", "hate", "dislike", "sad",
-            "angry", "frustrated", "fail", "lose", "worst", "problem", "issue",
-            "difficult", "hard", "challenging", "disappointing", "poor", "weak"
-        ];
+        let positive_words = positive_words();
+        let negative_words = negative_words();
         
         let words: Vec<&str> = text.split_whitespace().collect();
         let mut positive_count = 0;
@@ -231,9 +273,9 @@ impl AIService {
         
         for word in words {
             let word_lower = word.to_lowercase();
-            if positive_words.contains(&word_lower.as_str()) {
+            if positive_words.contains(word_lower.as_str()) {
                 positive_count += 1;
-            } else if negative_words.contains(&word_lower.as_str()) {
+            } else if negative_words.contains(word_lower.as_str()) {
                 negative_count += 1;
             }
         }
@@ -401,20 +443,7 @@ impl AIService {
     }
 
     fn is_common_word(&self, word: &str) -> bool {
-        let common_words = [
-            "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with",
-            "by", "from", "up", "about", "into", "through", "during", "before",
-            "after", "above", "below", "between", "among", "within", "without",
-            "this", "that", "these", "those", "is", "are", "was", "were", "be",
-            "been", "being", "have", "has", "had", "do", "does", "did", "will",
-            "would", "could", "should", "may", "might", "can", "shall", "must",
-            "not", "no", "yes", "if", "then", "else", "when", "where", "why",
-            "how", "what", "who", "which", "whose", "whom", "all", "any", "both",
-            "each", "few", "more", "most", "other", "some", "such", "only", "own",
-            "same", "so", "than", "too", "very", "can", "will", "just", "should",
-        ];
-        
-        common_words.contains(&word.to_lowercase().as_str())
+        common_words().contains(word.to_lowercase().as_str())
     }
 
     // Model download methods (placeholders)
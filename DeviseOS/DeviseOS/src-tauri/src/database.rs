@@ -205,19 +205,26 @@ impl Database {
         ).execute(&self.pool).await?;
 
         // Create indexes for better performance
+        // The listing indexes match the ORDER BY of get_notebooks, get_sections and
+        // get_pages so SQLite can walk them in order instead of sorting the results.
+        // Older databases carry narrower indexes under the previous names, so drop them.
         // Notebook indexes
-        sqlx::query("CREATE INDEX IF NOT EXISTS idx_notebooks_order_index ON notebooks (order_index)").execute(&self.pool).await?;
+        sqlx::query("DROP INDEX IF EXISTS idx_notebooks_order_index").execute(&self.pool).await?;
+        sqlx::query("CREATE INDEX IF NOT EXISTS idx_notebooks_listing ON notebooks (order_index, created_at)").execute(&self.pool).await?;
         sqlx::query("CREATE INDEX IF NOT EXISTS idx_notebooks_created_at ON notebooks (created_at)").execute(&self.pool).await?;
         
         // Section indexes
         sqlx::query("CREATE INDEX IF NOT EXISTS idx_sections_notebook_id ON sections (notebook_id)").execute(&self.pool).await?;
-        sqlx::query("CREATE INDEX IF NOT EXISTS idx_sections_order_index ON sections (notebook_id, order_index)").execute(&self.pool).await?;
+        sqlx::query("DROP INDEX IF EXISTS idx_sections_order_index").execute(&self.pool).await?;
+        sqlx::query("CREATE INDEX IF NOT EXISTS idx_sections_listing ON sections (notebook_id, order_index, created_at)").execute(&self.pool).await?;
         
-        // Page indexes
-        sqlx::query("CREATE INDEX IF NOT EXISTS idx_pages_notebook_id ON pages (notebook_id)").execute(&self.pool).await?;
+        // Page indexes (idx_pages_notebook_listing also serves lookups by notebook_id)
+        sqlx::query("DROP INDEX IF EXISTS idx_pages_notebook_id").execute(&self.pool).await?;
+        sqlx::query("CREATE INDEX IF NOT EXISTS idx_pages_notebook_listing ON pages (notebook_id, order_index, created_at)").execute(&self.pool).await?;
         sqlx::query("CREATE INDEX IF NOT EXISTS idx_pages_section_id ON pages (section_id)").execute(&self.pool).await?;
         sqlx::query("CREATE INDEX IF NOT EXISTS idx_pages_parent_page_id ON pages (parent_page_id)").execute(&self.pool).await?;
-        sqlx::query("CREATE INDEX IF NOT EXISTS idx_pages_order_index ON pages (notebook_id, section_id, order_index)").execute(&self.pool).await?;
+        sqlx::query("DROP INDEX IF EXISTS idx_pages_order_index").execute(&self.pool).await?;
+        sqlx::query("CREATE INDEX IF NOT EXISTS idx_pages_section_listing ON pages (notebook_id, section_id, order_index, created_at)").execute(&self.pool).await?;
         sqlx::query("CREATE INDEX IF NOT EXISTS idx_pages_created_at ON pages (created_at)").execute(&self.pool).await?;
         sqlx::query("CREATE INDEX IF NOT EXISTS idx_pages_updated_at ON pages (updated_at)").execute(&self.pool).await?;
         